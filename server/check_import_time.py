@@ -0,0 +1,88 @@
+"""
+앱 import 시간 측정 및 예산 체크
+
+`python -X importtime`으로 `main` 모듈을 import해 모듈별 누적 import 시간을 출력하고,
+아래 조건 중 하나라도 어기면 종료 코드 1을 반환합니다.
+
+- 전체 import 시간이 예산(IMPORT_BUDGET_MS, 기본 1500ms)을 초과
+- 지연 로드 대상 모듈(openpyxl, httpx)이 앱 시작 시점에 import됨
+
+사용법:
+    python check_import_time.py [--top 15]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+# 앱 시작 시 import되면 안 되는 무거운 모듈 (첫 요청 시 로드)
+LAZY_MODULES = ("openpyxl", "httpx")
+
+DEFAULT_BUDGET_MS = 1500
+
+
+def profile_imports(module: str = "main") -> list:
+    """모듈 import 시 `-X importtime` 결과를 (모듈명, self_us, cumulative_us) 목록으로 반환"""
+    server_dir = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=server_dir,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        raise RuntimeError(f"{module} import 실패")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        # 형식: "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].strip()
+        entries.append((name, int(parts[0]), int(parts[1])))
+    return entries
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="앱 import 시간 예산 체크")
+    parser.add_argument("--top", type=int, default=15, help="출력할 상위 모듈 수")
+    parser.add_argument(
+        "--budget-ms",
+        type=int,
+        default=int(os.getenv("IMPORT_BUDGET_MS", DEFAULT_BUDGET_MS)),
+        help="전체 import 시간 예산 (ms)",
+    )
+    args = parser.parse_args()
+
+    entries = profile_imports("main")
+    total_ms = next((cum for name, _, cum in entries if name == "main"), 0) / 1000
+
+    print(f"📊 [IMPORT] 상위 {args.top}개 모듈 (누적 기준)")
+    for name, self_us, cum_us in sorted(entries, key=lambda e: e[2], reverse=True)[:args.top]:
+        print(f"   {cum_us / 1000:8.1f}ms  (self {self_us / 1000:6.1f}ms)  {name}")
+
+    failed = False
+
+    loaded = sorted({
+        name for name, _, _ in entries
+        if name.split(".")[0] in LAZY_MODULES
+    })
+    if loaded:
+        failed = True
+        print(f"❌ [IMPORT] 지연 로드 대상 모듈이 시작 시 import됨: {', '.join(loaded)}")
+
+    if total_ms > args.budget_ms:
+        failed = True
+        print(f"❌ [IMPORT] main import {total_ms:.1f}ms - 예산 {args.budget_ms}ms 초과")
+    else:
+        print(f"✅ [IMPORT] main import {total_ms:.1f}ms (예산 {args.budget_ms}ms)")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
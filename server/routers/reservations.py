@@ -2,16 +2,11 @@ from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
 from models import ReservationRequest, ReservationBatchResponse
-from services.reservation_service import ReservationService
-from services.excel_service import ExcelService
+from services import get_reservation_service, get_excel_service
 from utils.session import get_session_from_cookies
 
 router = APIRouter(prefix="/api", tags=["reservations"])
 
-# 서비스 인스턴스
-reservation_service = ReservationService()
-excel_service = ExcelService()
-
 @router.post("/reservations", response_model=ReservationBatchResponse)
 async def get_reservations(reservation_request: ReservationRequest, request: Request):
     """예약률 데이터 가져오기 API"""
@@ -22,7 +17,7 @@ async def get_reservations(reservation_request: ReservationRequest, request: Req
             raise HTTPException(status_code=401, detail="세션이 설정되지 않았습니다.")
         
         # 예약률 데이터 수집
-        result = await reservation_service.get_reservations(reservation_request, session)
+        result = await get_reservation_service().get_reservations(reservation_request, session)
         
         return result
         
@@ -44,7 +39,7 @@ async def download_excel(reservation_request: ReservationRequest, request: Reque
         print(f"📥 [DOWNLOAD] 엑셀 다운로드 요청: {reservation_request}")
         
         # 예약률 데이터 수집
-        data = await reservation_service.get_reservations(reservation_request, session)
+        data = await get_reservation_service().get_reservations(reservation_request, session)
         
         # 403 오류 시 즉시 중단
         for reservation_data in data.data:
@@ -52,7 +47,8 @@ async def download_excel(reservation_request: ReservationRequest, request: Reque
                 print(f"🚫 [ERROR] 세션 만료로 인한 다운로드 중단")
                 raise HTTPException(status_code=403, detail="세션이 만료되었습니다. 다시 로그인해주세요.")
         
-        # 엑셀 파일 생성
+        # 엑셀 파일 생성 (openpyxl은 이 시점에 처음 로드됨)
+        excel_service = get_excel_service()
         buffer = excel_service.create_excel_file(data, reservation_request)
         
         # 파일명 생성
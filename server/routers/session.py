@@ -2,7 +2,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 
 from utils.session import get_session_from_cookies
-from services.reservation_service import ReservationService
+from services import get_reservation_service
 
 router = APIRouter(prefix="/api", tags=["session"])
 
@@ -25,7 +25,6 @@ async def get_session_info(request: Request):
 @router.post("/validate_session")
 async def validate_session(request: Request):
     """세션 유효성을 실제 외부 API 호출로 검증"""
-    from services.reservation_service import ReservationService
     import httpx
     
     session = get_session_from_cookies(request)
@@ -36,7 +35,7 @@ async def validate_session(request: Request):
         )
     
     # 테스트용 더미 데이터로 외부 API 호출
-    reservation_service = ReservationService()
+    reservation_service = get_reservation_service()
     
     try:
         async with httpx.AsyncClient(timeout=10.0) as client:
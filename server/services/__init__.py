@@ -1 +1,16 @@
 # Services module
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def get_reservation_service():
+    """ReservationService 싱글톤 (httpx는 첫 호출 시 로드)"""
+    from services.reservation_service import ReservationService
+    return ReservationService()
+
+
+@lru_cache(maxsize=None)
+def get_excel_service():
+    """ExcelService 싱글톤 (openpyxl은 첫 엑셀 다운로드 시 로드)"""
+    from services.excel_service import ExcelService
+    return ExcelService()